@@ -5,18 +5,141 @@ Its canonical open-source location is:
 https://github.com/Temerold/heart-all/blob/main/heart_all.py
 """
 
+import functools
+import itertools
 import logging
+import math
 import sys
-from collections.abc import Mapping
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from types import TracebackType
-from typing import Union
+from typing import Any, Final, NamedTuple, Union
 
+import requests
 import yaml
 from dotenv import dotenv_values
+from requests.adapters import HTTPAdapter
 from spotipy import Spotify, SpotifyException
 from spotipy.exceptions import SpotifyOauthError
 from spotipy.oauth2 import SpotifyOAuth
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is an optional speedup
+    from json import loads as json_loads
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader
+
+SCRIPT_DIR: Final[Path] = Path(__file__).resolve().parent
+
+# Largest ID list the saved-tracks endpoints accept, and their largest page size
+MAX_IDS_PER_REQUEST: int = 50
+MAX_RETRIES: int = 3
+MAX_WORKERS: int = 8
+REQUESTS_PER_SECOND: float = 10.0
+RETRY_BACKOFF_SECONDS: float = 0.5
+RETRY_STATUSES: frozenset[int] = frozenset([429, 500, 502, 503, 504])
+
+# Only what's needed to save and log each track, plus what paging needs
+PLAYLIST_ITEM_FIELDS: str = "items(track(id,name,artists(name))),limit,offset,total"
+
+SPOTIPY_CLIENT_ENV_VAR_PROMPTS: tuple[tuple[str, str], ...] = (
+    ("SPOTIPY_CLIENT_ID", "Please input Spotify application client ID: "),
+    ("SPOTIPY_CLIENT_SECRET", "Please input Spotify application client secret: "),
+    ("SPOTIPY_REDIRECT_URI", "Please input Spotify application redirect URI: "),
+)
+
+
+class Track(NamedTuple):
+    """The parts of a playlist track that are needed to save and log it."""
+
+    id: str
+    artist_names: list[str]
+    name: str
+
+
+@dataclass(slots=True)
+class QueueStats:
+    """Counters filled in while the saveable tracks of a playlist are consumed."""
+
+    track_count: int
+    queued_tracks: int = 0
+
+
+class RateLimiter:
+    """Thread-safe leaky bucket that spaces out calls to the Spotify API."""
+
+    def __init__(self, requests_per_second: float) -> None:
+        self._interval: float = 1 / requests_per_second
+        self._lock: threading.Lock = threading.Lock()
+        self._next_slot: float = time.monotonic()
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self._next_slot = max(self._next_slot, time.monotonic() + seconds)
+
+    def wait(self) -> None:
+        with self._lock:
+            now: float = time.monotonic()
+            delay: float = self._next_slot - now
+            self._next_slot = max(self._next_slot, now) + self._interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+@dataclass(slots=True)
+class AppContext:
+    """State shared by a run: the loaded config and the rate-limited API client."""
+
+    config: dict
+    client: Spotify
+    rate_limiter: RateLimiter
+
+
+class JSONSession(requests.Session):
+    """Session that decodes Spotify API responses with orjson when available."""
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        response: requests.Response = super().send(request, **kwargs)
+        response.json = lambda **_: json_loads(response.content)
+        return response
+
+
+def build_spotipy_client(auth_manager: SpotifyOAuth) -> Spotify:
+    return Spotify(
+        auth_manager=auth_manager,
+        requests_session=get_requests_session(),
+        requests_timeout=10,
+    )
+
+
+def call_rate_limited(
+    rate_limiter: RateLimiter, function: Callable[..., Any], *args, **kwargs
+) -> Any:
+    # The only retry budget for error responses: pausing the shared bucket holds
+    # back every worker, not just the one that was throttled
+    for attempt in range(MAX_RETRIES + 1):
+        rate_limiter.wait()
+        try:
+            return function(*args, **kwargs)
+        except SpotifyException as exception:
+            if exception.http_status not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                raise
+            retry_after: str | None = exception.headers.get("Retry-After")
+            rate_limiter.pause(
+                float(retry_after)
+                if retry_after
+                else RETRY_BACKOFF_SECONDS * 2**attempt
+            )
 
 
 def excepthook(
@@ -29,123 +152,218 @@ def excepthook(
     sys.__excepthook__(exc_type, exc_value, exc_traceback)
 
 
-def get_formatted_track_number(queued_tracks: int, track_count: int) -> str:
-    return f"{str((queued_tracks + 1)).rjust(len(str(track_count)))}/{track_count}"
+def get_formatted_track_number(queued_tracks: int, track_count: int, width: int) -> str:
+    return f"{queued_tracks + 1:>{width}}/{track_count}"
+
+
+def get_pages(fetch_page: Callable[..., dict], offsets: range) -> Iterator[dict]:
+    for _, future in map_concurrently(
+        lambda offset: fetch_page(offset=offset, limit=offsets.step), offsets
+    ):
+        yield future.result()
+
+
+def get_remaining_pages(
+    fetch_page: Callable[..., dict], first_page: dict[str, Union[str, list, int, None]]
+) -> Iterator[dict]:
+    limit: int = first_page["limit"]
+    yield from get_pages(
+        fetch_page, range(first_page["offset"] + limit, first_page["total"], limit)
+    )
+
+
+def get_requests_session() -> requests.Session:
+    # Passing our own session skips spotipy's retrying adapter, so mount one with a
+    # connection pool large enough for both concurrent pipelines. It only retries
+    # failed connections; error responses are retried by call_rate_limited, which
+    # needs their Retry-After header
+    session: requests.Session = JSONSession()
+    session.headers["Accept-Encoding"] = "gzip"
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_maxsize=4 * MAX_WORKERS,
+            max_retries=Retry(
+                total=3,
+                read=False,
+                status=0,
+                backoff_factor=0.5,
+                allowed_methods=frozenset(["GET", "POST", "PUT", "DELETE"]),
+                respect_retry_after_header=False,
+            ),
+        ),
+    )
+    return session
 
 
 def get_saveable_tracks(
-    spotipy_client: Spotify, items: dict[str, Union[str, list, int, None]]
-) -> Mapping[str, Union[list, int]]:
-    tracks: list[dict] = []
-    track_count: int = items["total"]
-    queued_tracks: int = 0
-    while items:
-        for item in items["items"]:
+    context: AppContext,
+    playlist_id: str,
+    items: dict[str, Union[str, list, int, None]],
+    stats: QueueStats,
+) -> Iterator[Track]:
+    width: int = len(str(stats.track_count))
+    want_info: bool = logging.getLogger().isEnabledFor(logging.INFO)
+    fetch_page: Callable[..., dict] = functools.partial(
+        call_rate_limited,
+        context.rate_limiter,
+        context.client.playlist_items,
+        playlist_id,
+        fields=PLAYLIST_ITEM_FIELDS,
+        additional_types=("track",),
+    )
+    for page in itertools.chain([items], get_remaining_pages(fetch_page, items)):
+        for item in page["items"]:
             track: dict[str, str] | None = item.get("track")
             if track is None or track.get("id") is None:
                 continue
-            tracks.append(track)
+            # Artist names only feed the log messages
+            saveable_track: Track = Track(
+                track["id"],
+                get_track_artist_names(track) if want_info else [],
+                track["name"],
+            )
 
             formatted_track_number = get_formatted_track_number(
-                queued_tracks, track_count
+                stats.queued_tracks, stats.track_count, width
+            )
+            track_info_appendix: str = (
+                get_track_info_appendix(saveable_track) if want_info else ""
             )
-            track_info_appendix: str = get_track_info_appendix(track)
-            queue_message: str = (
-                f"{formatted_track_number} Queued track with ID {track["id"]}"
-                f"{track_info_appendix}"
+            logging.info(
+                "%s Queued track with ID %s%s",
+                formatted_track_number,
+                saveable_track.id,
+                track_info_appendix,
             )
-            logging.info(queue_message)
 
-            queued_tracks += 1
+            stats.queued_tracks += 1
+            yield saveable_track
 
-        if not items["next"]:
-            break
-        items = spotipy_client.next(items)
 
-    return {
-        "tracks": tracks,
-        "track_count": track_count,
-        "queued_tracks": queued_tracks,
-    }
+def get_saved_ids(context: AppContext, track_count: int) -> set[str] | None:
+    # Paging through the library only beats checking each chunk with contains() when
+    # it takes fewer requests, counting the one spent on learning the library size
+    chunk_count: int = math.ceil(track_count / MAX_IDS_PER_REQUEST)
+    if chunk_count <= 2:
+        return None
+
+    fetch_page: Callable[..., dict] = functools.partial(
+        call_rate_limited,
+        context.rate_limiter,
+        context.client.current_user_saved_tracks,
+    )
+    try:
+        library_size: int = fetch_page(limit=1)["total"]
+        if math.ceil(library_size / MAX_IDS_PER_REQUEST) >= chunk_count:
+            return None
+        return {
+            item["track"]["id"]
+            for page in get_pages(
+                fetch_page, range(0, library_size, MAX_IDS_PER_REQUEST)
+            )
+            for item in page["items"]
+        }
+    except SpotifyException as exception:
+        logging.error(
+            "Error fetching saved tracks, checking each chunk instead",
+            exc_info=exception,
+        )
+        return None
 
 
-def get_spotipy_client(scope: list[str] = None) -> Spotify:
+def get_spotipy_client(
+    env_secrets: dict[str, str | None],
+    rate_limiter: RateLimiter,
+    scope: list[str] = None,
+) -> tuple[Spotify, dict]:
     if scope is None:
         scope = ["user-library-read", "user-library-modify"]
 
-    if Path.exists(Path(__file__).parent / ".cache"):
-        auth_manager = SpotifyOAuth(
-            client_id=" ", client_secret=" ", redirect_uri=" ", scope=scope
+    user: dict | None = None
+    exception: Exception | None
+    env_vars: dict[str, str | None] = get_spotipy_client_env_vars(env_secrets)
+    if (SCRIPT_DIR / ".cache").exists():
+        # Use whatever credentials are known so the token can be refreshed mid-run
+        spotipy_client: Spotify = build_spotipy_client(
+            get_spotipy_oauth(env_vars, scope)
         )
-        valid, exception = validate_spotipy_client(auth_manager)
-    else:
-        valid: bool = False
+        user, exception = validate_spotipy_client(spotipy_client, rate_limiter)
 
-    env_vars: dict[str, str | None] = get_spotipy_client_env_vars()
-    if not valid:  # `.cache` is either missing or invalid
-        if not env_vars["SPOTIPY_CLIENT_ID"]:
-            env_vars["SPOTIPY_CLIENT_ID"] = input(
-                "Please input Spotify application client ID: "
-            )
+    if not user:  # `.cache` is either missing or invalid
+        for key, prompt in SPOTIPY_CLIENT_ENV_VAR_PROMPTS:
+            env_vars[key] = env_vars[key] or input(prompt)
 
-        if not env_vars["SPOTIPY_CLIENT_SECRET"]:
-            env_vars["SPOTIPY_CLIENT_SECRET"] = input(
-                "Please input Spotify application client secret: "
-            )
+        spotipy_client = build_spotipy_client(get_spotipy_oauth(env_vars, scope))
+        user, exception = validate_spotipy_client(spotipy_client, rate_limiter)
+        if not user:
+            message: str = "Invalid Spotify application credentials."
+            logging.error(message, exc_info=exception)
+            print(message)
+            sys.exit(1)
+
+    return spotipy_client, user
 
-        if not env_vars["SPOTIPY_REDIRECT_URI"]:
-            env_vars["SPOTIPY_REDIRECT_URI"] = input(
-                "Please input Spotify application redirect URI: "
-            )
 
-    auth_manager = SpotifyOAuth(
+def get_spotipy_client_env_vars(
+    env_secrets: dict[str, str | None],
+) -> dict[str, str | None]:
+    return {key: env_secrets.get(key) for key, _ in SPOTIPY_CLIENT_ENV_VAR_PROMPTS}
+
+
+def get_spotipy_oauth(
+    env_vars: dict[str, str | None], scope: list[str]
+) -> SpotifyOAuth:
+    return SpotifyOAuth(
         client_id=env_vars["SPOTIPY_CLIENT_ID"] or " ",
         client_secret=env_vars["SPOTIPY_CLIENT_SECRET"] or " ",
         redirect_uri=env_vars["SPOTIPY_REDIRECT_URI"] or " ",
         scope=scope,
     )
-    valid, exception = validate_spotipy_client(auth_manager)
-    valid: bool
-    exception: Exception | None
-    if not valid:
-        message: str = "Invalid Spotify application credentials."
-        logging.error(message, exc_info=exception)
-        print(message)
-        sys.exit(1)
-
-    return Spotify(auth_manager=auth_manager)
-
-
-def get_spotipy_client_env_vars() -> dict[str, str | None]:
-    return {
-        "SPOTIPY_CLIENT_ID": env_secrets.get("SPOTIPY_CLIENT_ID"),
-        "SPOTIPY_CLIENT_SECRET": env_secrets.get("SPOTIPY_CLIENT_SECRET"),
-        "SPOTIPY_REDIRECT_URI": env_secrets.get("SPOTIPY_REDIRECT_URI"),
-    }
 
 
 def get_track_artist_names(track: dict[str, str]) -> list[str]:
-    return [track["artists"][i]["name"] for i, _ in enumerate(track["artists"])]
+    return [artist["name"] for artist in track["artists"]]
 
 
-def get_track_info_appendix(track: dict[str, str]) -> str:
-    track_artists: list[str] = get_track_artist_names(track)
-    track_name: str = track["name"]
-    if list(filter(lambda i: i, track_artists)) and list(
-        filter(lambda i: i, track_name)
-    ):
-        return f": {", ".join(track_artists)} - {track_name}"
+def get_track_info_appendix(track: Track) -> str:
+    if any(track.artist_names) and track.name:
+        return f": {", ".join(filter(None, track.artist_names))} - {track.name}"
     return ""
 
 
-def load_environment_and_config() -> None:
-    global env_secrets, config
+def get_unique_tracks(tracks: Iterable[Track]) -> Iterator[Track]:
+    seen_ids: set[str] = set()
+    for position, track in enumerate(tracks, 1):
+        if track.id in seen_ids:
+            logging.debug(
+                "Skipping duplicate of track with ID %s at position %d",
+                track.id,
+                position,
+            )
+            continue
+        seen_ids.add(track.id)
+        yield track
+
+
+def is_terminal_record(record: logging.LogRecord) -> bool:
+    # Mirror the script's own info messages to the terminal; errors are printed
+    # explicitly, and `extra={"terminal_output": False}` keeps a message log-only
+    return (
+        record.name == "root"
+        and record.levelno == logging.INFO
+        and getattr(record, "terminal_output", True)
+    )
+
 
-    env_secrets = dotenv_values(".env")
-    config = None
-    for file in (recognized_config_files := ["config.yaml", "config.yml"]):
-        if Path.exists(Path(__file__).parent / file):
-            config = load_yaml_file(file)
+def load_environment_and_config() -> tuple[dict[str, str | None], dict]:
+    env_secrets: dict[str, str | None] = dotenv_values(".env")
+    recognized_config_files: list[str] = ["config.yaml", "config.yml"]
+    config_file: str | None = next(
+        (file for file in recognized_config_files if (SCRIPT_DIR / file).is_file()),
+        None,
+    )
+    config: dict | None = load_yaml_file(config_file) if config_file else None
 
     if not config:
         raise FileNotFoundError(
@@ -160,95 +378,142 @@ def load_environment_and_config() -> None:
         format="%(asctime)s:%(levelname)s:%(message)s",
         level=20,
     )
-    logging.info = logging_info_override
+    terminal_handler: logging.StreamHandler = logging.StreamHandler(sys.stdout)
+    terminal_handler.addFilter(is_terminal_record)
+    logging.getLogger().addHandler(terminal_handler)
     logger: logging.Logger = logging.getLogger(__name__)
     sys.excepthook = lambda type, value, traceback: excepthook(
         logger, type, value, traceback
     )
 
+    return env_secrets, config
+
 
 def load_yaml_file(filepath: Path | str) -> dict[str, str]:
-    script_dir: Path = Path(__file__).parent
-    filepath: Path = script_dir / filepath
+    filepath: Path = SCRIPT_DIR / filepath
     with open(filepath, "r", encoding="utf-8") as file:
-        return yaml.safe_load(file)
-
-
-def logging_info_override(
-    message: str, *args, terminal_output: bool = True, **kwargs
-) -> None:
-    logging.getLogger().log(20, message, *args, **kwargs)
-    if terminal_output:
-        print(message % args if args else message)
+        return yaml.load(file, Loader=SafeLoader)
+
+
+def map_concurrently(
+    function: Callable[[Any], Any], arguments: Iterable
+) -> Iterator[tuple[Any, Future]]:
+    # Yields each argument with its future in input order, keeping only a bounded
+    # number of calls in flight so that `arguments` is consumed lazily
+    pending: deque[tuple[Any, Future]] = deque()
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        for argument in arguments:
+            pending.append((argument, executor.submit(function, argument)))
+            if len(pending) > 2 * MAX_WORKERS:
+                yield pending.popleft()
+        yield from pending
+
+
+def save_track_chunk(
+    context: AppContext, saved_ids: set[str] | None, chunk: tuple[Track, ...]
+) -> list[bool]:
+    track_ids: list[str] = [track.id for track in chunk]
+    contained: list[bool]
+    if saved_ids is None:
+        contained = call_rate_limited(
+            context.rate_limiter,
+            context.client.current_user_saved_tracks_contains,
+            track_ids,
+        )
+    else:
+        contained = [track_id in saved_ids for track_id in track_ids]
+    unsaved_ids: list[str] = [
+        track_id for track_id, saved in zip(track_ids, contained) if not saved
+    ]
+    if unsaved_ids:
+        call_rate_limited(
+            context.rate_limiter,
+            context.client.current_user_saved_tracks_add,
+            unsaved_ids,
+        )
+    return contained
 
 
-def save_tracks(
-    spotipy_client: Spotify, tracks: dict[str, list | int]
-) -> tuple[int, int]:
+def save_tracks(context: AppContext, tracks: list[Track]) -> tuple[int, int]:
     tracks_saved: int = 0
     error_count: int = 0
-    track_id: str | None = None
-    for i, track in enumerate(tracks["tracks"]):
-        track_id = track["id"]
+    track_number: int = 0
+    track_count: int = len(tracks)
+    width: int = len(str(track_count))
+    want_info: bool = logging.getLogger().isEnabledFor(logging.INFO)
+
+    saved_ids: set[str] | None = get_saved_ids(context, track_count)
+
+    save_chunk: Callable[[tuple[Track, ...]], list[bool]] = functools.partial(
+        save_track_chunk, context, saved_ids
+    )
+    chunks: Iterator[tuple[Track, ...]] = itertools.batched(tracks, MAX_IDS_PER_REQUEST)
+    for chunk, future in map_concurrently(save_chunk, chunks):
         try:
-            formatted_track_number = get_formatted_track_number(
-                i, len(tracks["tracks"])
+            contained: list[bool] = future.result()
+        except SpotifyException as exception:
+            logging.error(
+                "Error saving tracks with IDs %s",
+                ", ".join(track.id for track in chunk),
+                exc_info=exception,
             )
-            track_info_appendix: str = get_track_info_appendix(track)
-            if spotipy_client.current_user_saved_tracks_contains([track_id])[0]:
-                message: str = (
-                    f"{formatted_track_number} Track with ID {track_id} already saved"
-                    f"{track_info_appendix}"
-                )
-                logging.info(message)
-                continue
 
-            spotipy_client.current_user_saved_tracks_add([track_id])
+            error_count += len(chunk)
+            track_number += len(chunk)
+            continue
 
-            message = (
-                f"{formatted_track_number} Saved track with ID {track_id}"
-                f"{track_info_appendix}"
+        for track, saved in zip(chunk, contained):
+            formatted_track_number = get_formatted_track_number(
+                track_number, track_count, width
             )
-            logging.info(message)
-
-            tracks_saved += 1
-        except SpotifyException as exception:
-            message: str = f"Error saving track with ID {track_id}"
-            logging.error(message, exc_info=exception)
+            track_info_appendix: str = (
+                get_track_info_appendix(track) if want_info else ""
+            )
+            message: str = "%s Track with ID %s already saved%s"
+            if not saved:
+                message = "%s Saved track with ID %s%s"
+                tracks_saved += 1
+            logging.info(message, formatted_track_number, track.id, track_info_appendix)
 
-            error_count += 1
+            track_number += 1
 
     return tracks_saved, error_count
 
 
 def validate_spotipy_client(
-    auth_manager: SpotifyOAuth,
-) -> tuple[bool, Union[Exception, None]]:
+    spotipy_client: Spotify, rate_limiter: RateLimiter
+) -> tuple[Union[dict, None], Union[Exception, None]]:
     try:
-        Spotify(auth_manager=auth_manager).current_user()
-        return True, None
+        return call_rate_limited(rate_limiter, spotipy_client.current_user), None
     except SpotifyOauthError as exception:
-        return False, exception
+        return None, exception
 
 
 def main() -> None:
-    spotipy_client: Spotify = get_spotipy_client()
-    if not spotipy_client.current_user():
-        message = "Failed to authenticate with Spotify."
-        logging.error(message)
-        print(message)
-        return
+    env_secrets, config = load_environment_and_config()
+    env_secrets: dict[str, str | None]
+    config: dict
+    rate_limiter: RateLimiter = RateLimiter(REQUESTS_PER_SECOND)
+    spotipy_client, user = get_spotipy_client(env_secrets, rate_limiter)
+    spotipy_client: Spotify
+    user: dict
+    context: AppContext = AppContext(
+        config=config, client=spotipy_client, rate_limiter=rate_limiter
+    )
     logging.info(
-        "Successfully authenticated with Spotify as user %s",
-        spotipy_client.current_user()["display_name"],
+        "Successfully authenticated with Spotify as user %s", user["display_name"]
     )
 
-    if not (playlist_id := config["playlist_id"]):
+    if not (playlist_id := context.config["playlist_id"]):
         playlist_id: str = input("Please input ID of playlist to forcibly save: ")
 
     try:
-        items: dict[str, Union[str, list, int, None]] = spotipy_client.playlist_items(
-            playlist_id
+        items: dict[str, Union[str, list, int, None]] = call_rate_limited(
+            rate_limiter,
+            spotipy_client.playlist_items,
+            playlist_id,
+            fields=PLAYLIST_ITEM_FIELDS,
+            additional_types=("track",),
         )
     except SpotifyException as exception:
         # pylint: disable=line-too-long
@@ -261,18 +526,22 @@ def main() -> None:
         print(message)
         return
 
-    saveable_tracks: Mapping[str, Union[list, int]] = get_saveable_tracks(
-        spotipy_client, items
+    stats: QueueStats = QueueStats(track_count=items["total"])
+    # Only the slim tracks are kept, so collecting them all is cheap, and it gives the
+    # save progress an exact total of the unique tracks that will be saved
+    saveable_tracks: list[Track] = list(
+        get_unique_tracks(get_saveable_tracks(context, playlist_id, items, stats))
     )
-    tracks_saved, error_count = save_tracks(spotipy_client, saveable_tracks)
+    duplicate_count: int = stats.queued_tracks - len(saveable_tracks)
+    tracks_saved, error_count = save_tracks(context, saveable_tracks)
     tracks_saved: int
     error_count: int
 
-    appendix: str = (
-        f" Forcibly saved {tracks_saved}/" f"{saveable_tracks["queued_tracks"]} tracks"
-    )
+    appendix: str = f" Forcibly saved {tracks_saved}/{len(saveable_tracks)} tracks"
+    if duplicate_count:
+        appendix += f", skipped {duplicate_count} duplicates"
     if error_count:
-        absolute_log_filename: Path = Path(config["log_filename"]).absolute()
+        absolute_log_filename: Path = Path(context.config["log_filename"]).absolute()
         logging.info(
             "Finished with %d errors. See logs for more information: %s%s",
             error_count,
@@ -284,7 +553,4 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    env_secrets: dict[str, str | None]
-    config: dict
-    load_environment_and_config()
     main()